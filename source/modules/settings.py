@@ -5,6 +5,7 @@ import os
 import shutil
 import sys
 import uuid
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -68,6 +69,20 @@ delete_action = {
     "Delete Permanently": 1,
 }
 
+# Defaults of the boolean settings that are also read together (see get_settings_snapshot)
+bool_defaults = {
+    "show_stable_builds": True,
+    "show_daily_builds": True,
+    "show_experimental_and_patch_builds": True,
+    "show_bfa_builds": True,
+    "scrape_stable_builds": True,
+    "scrape_automated_builds": True,
+    "scrape_bfa_builds": True,
+    "use_system_title_bar": False,
+    "enable_high_dpi_scaling": True,
+    "show_tray_icon": False,
+}
+
 
 def get_settings():
     file = get_config_file()
@@ -77,6 +92,57 @@ def get_settings():
     return QSettings(get_config_file().as_posix(), QSettings.Format.IniFormat)
 
 
+def get_bool(key: str, settings: QSettings | None = None) -> bool:
+    if settings is None:
+        settings = get_settings()
+    return settings.value(key, defaultValue=bool_defaults[key], type=bool)
+
+
+@dataclass(frozen=True)
+class RepoSettings:
+    """Which repositories are visible in the library and scraped for new builds.
+    The field names are the setting keys"""
+
+    show_stable_builds: bool
+    show_daily_builds: bool
+    show_experimental_and_patch_builds: bool
+    show_bfa_builds: bool
+    scrape_stable_builds: bool
+    scrape_automated_builds: bool
+    scrape_bfa_builds: bool
+
+
+def get_repo_settings(settings: QSettings | None = None) -> RepoSettings:
+    if settings is None:
+        settings = get_settings()
+    return RepoSettings(**{f.name: get_bool(f.name, settings) for f in fields(RepoSettings)})
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """The settings shown by the first-time setup, read all at once"""
+
+    library_folder: Path | None  # as stored, not checked for validity
+    repos: RepoSettings
+    use_system_titlebar: bool
+    enable_high_dpi_scaling: bool
+    show_tray_icon: bool
+
+
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Reads the settings in SettingsSnapshot from a single QSettings instance.
+    Every get_* function opens and parses the config file again, which adds up when many are needed together"""
+    settings = get_settings()
+    library_folder = settings.value("library_folder")
+    return SettingsSnapshot(
+        library_folder=Path(library_folder) if library_folder else None,
+        repos=get_repo_settings(settings),
+        use_system_titlebar=get_bool("use_system_title_bar", settings),
+        enable_high_dpi_scaling=get_bool("enable_high_dpi_scaling", settings),
+        show_tray_icon=get_bool("show_tray_icon", settings),
+    )
+
+
 def get_actual_library_folder_no_fallback():
     v = get_settings().value("library_folder")
     if v:
@@ -202,7 +268,7 @@ def set_launch_minimized_to_tray(is_checked):
 
 
 def get_enable_high_dpi_scaling():
-    return get_settings().value("enable_high_dpi_scaling", defaultValue=True, type=bool)
+    return get_bool("enable_high_dpi_scaling")
 
 
 def set_enable_high_dpi_scaling(is_checked):
@@ -290,7 +356,7 @@ def set_install_template(is_checked):
 
 
 def get_show_tray_icon():
-    return get_settings().value("show_tray_icon", defaultValue=False, type=bool)
+    return get_bool("show_tray_icon")
 
 
 def set_show_tray_icon(is_checked):
@@ -459,7 +525,7 @@ def set_minimum_blender_stable_version(blender_minimum_version: str):
 
 
 def get_scrape_stable_builds() -> bool:
-    return get_settings().value("scrape_stable_builds", defaultValue=True, type=bool)
+    return get_bool("scrape_stable_builds")
 
 
 def set_scrape_stable_builds(b: bool):
@@ -467,7 +533,7 @@ def set_scrape_stable_builds(b: bool):
 
 
 def get_scrape_automated_builds() -> bool:
-    return get_settings().value("scrape_automated_builds", defaultValue=True, type=bool)
+    return get_bool("scrape_automated_builds")
 
 
 def set_scrape_automated_builds(b: bool):
@@ -475,7 +541,7 @@ def set_scrape_automated_builds(b: bool):
 
 
 def get_scrape_bfa_builds() -> bool:
-    return get_settings().value("scrape_bfa_builds", defaultValue=True, type=bool)
+    return get_bool("scrape_bfa_builds")
 
 
 def set_scrape_bfa_builds(b: bool):
@@ -483,7 +549,7 @@ def set_scrape_bfa_builds(b: bool):
 
 
 def get_show_stable_builds() -> bool:
-    return get_settings().value("show_stable_builds", defaultValue=True, type=bool)
+    return get_bool("show_stable_builds")
 
 
 def set_show_stable_builds(b: bool):
@@ -491,7 +557,7 @@ def set_show_stable_builds(b: bool):
 
 
 def get_show_daily_builds() -> bool:
-    return get_settings().value("show_daily_builds", defaultValue=True, type=bool)
+    return get_bool("show_daily_builds")
 
 
 def set_show_daily_builds(b: bool):
@@ -499,7 +565,7 @@ def set_show_daily_builds(b: bool):
 
 
 def get_show_experimental_and_patch_builds() -> bool:
-    return get_settings().value("show_experimental_and_patch_builds", defaultValue=True, type=bool)
+    return get_bool("show_experimental_and_patch_builds")
 
 
 def set_show_experimental_and_patch_builds(b: bool):
@@ -507,7 +573,7 @@ def set_show_experimental_and_patch_builds(b: bool):
 
 
 def get_show_bfa_builds() -> bool:
-    return get_settings().value("show_bfa_builds", defaultValue=True, type=bool)
+    return get_bool("show_bfa_builds")
 
 
 def set_show_bfa_builds(b: bool):
@@ -575,7 +641,7 @@ def set_use_pre_release_builds(b: bool):
 
 
 def get_use_system_titlebar():
-    return get_settings().value("use_system_title_bar", defaultValue=False, type=bool)
+    return get_bool("use_system_title_bar")
 
 
 def set_use_system_titlebar(b: bool):
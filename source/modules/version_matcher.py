@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import contextlib
 import datetime
-import re
-from dataclasses import dataclass
-from functools import cache
+import string
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from semver import Version
 
@@ -18,24 +18,26 @@ if TYPE_CHECKING:
 utc = datetime.timezone.utc
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BasicBuildInfo:
     version: Version
     branch: str
     build_hash: str
     commit_time: datetime.datetime
 
-    @property
-    def major(self):
-        return self.version.major
-
-    @property
-    def minor(self):
-        return self.version.minor
+    # Stored rather than looked up through self.version since BInfoMatcher reads them for every build
+    major: int = field(init=False, repr=False, compare=False)
+    minor: int = field(init=False, repr=False, compare=False)
+    patch: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def patch(self):
-        return self.version.patch
+    def __post_init__(self):
+        version = self.version
+        # The dataclass is frozen, so set these through object.__setattr__.
+        # Only a handful of branch names exist, interning them lets the matcher's comparisons short-circuit on identity
+        object.__setattr__(self, "branch", sys.intern(self.branch))
+        object.__setattr__(self, "major", version.major)
+        object.__setattr__(self, "minor", version.minor)
+        object.__setattr__(self, "patch", version.patch)
 
     def __lt__(self, other: BasicBuildInfo):
         if self.version == other.version:
@@ -45,14 +47,25 @@ class BasicBuildInfo:
 
     @classmethod
     def from_buildinfo(cls, buildinfo: BuildInfo):
-        return BasicBuildInfo(
-            version=buildinfo.full_semversion,
-            branch=buildinfo.branch,
-            build_hash=buildinfo.build_hash if buildinfo.build_hash is not None else "",
-            commit_time=buildinfo.commit_time.astimezone(utc),
+        return _basic_build_info(
+            buildinfo.full_semversion,
+            buildinfo.branch,
+            buildinfo.build_hash if buildinfo.build_hash is not None else "",
+            buildinfo.commit_time,
         )
 
 
+@lru_cache(maxsize=1024)
+def _basic_build_info(version: Version, branch: str, build_hash: str, commit_time: datetime.datetime) -> BasicBuildInfo:
+    """Creates a BasicBuildInfo, reusing the previous one (and its UTC conversion) for builds that were already seen"""
+    return BasicBuildInfo(
+        version=version,
+        branch=branch,
+        build_hash=build_hash,
+        commit_time=commit_time.astimezone(utc),
+    )
+
+
 # VersionSearchQuerySyntax (NOT SEMVER COMPATIBLE!):
 
 # ^   | match the largest/newest item in that column
@@ -71,23 +84,16 @@ VERSION_SEARCH_SYNTAX = "<major_num>.<minor>.<patch>[-<branch>][+<build_hash>][@
 # And of course, a full example:
 # 4.3.^-stable+cb886aba06d5@2024-07-31T23:53:51+00:00
 
-VERSION_SEARCH_REGEX = re.compile(
-    r"""^
-    ([\^\-\*]|\d+)\.([\^\-\*]|\d+)\.([\^\-\*]|\d+)
-    (?:\-([^\@\s\+]+))?
-    (?:\+([\d\w]+))?
-    (?:\@([\^\-\*]|[\dT\+\:Z\ \^\-]+))?
-    $""",
-    flags=re.X,
-)
-
-# Regex breakdown:
-# ^                                     -- start of string
-# ([\^\-\*]|\d+)                     x3 -- major, minor, and patch (required)
-# (?:\-([^\@\s\+]+))?                   -- branch (optional)
-# (?:\+([\d\w]+))?                      -- build hash (optional)
-# (?:\@([\dT\+\:Z\ \^\*\-]+))?            -- commit time (saved as ^|*|- or an isoformat) (optional)
-# $                                     -- end of string
+# Grammar breakdown:
+# <major>.<minor>.<patch>  -- each is ^, *, - or a number (required)
+# -<branch>                -- anything but "@", "+" and whitespace (optional)
+# +<build_hash>            -- letters, digits and "_", usually a git hash but e.g. "unknown" for non-git builds (optional)
+# @<commit time>           -- ^, *, - or an isoformat made of digits, "T", "+", ":", "Z", " ", "^" and "-" (optional)
+
+_SENTINELS = frozenset("^*-")
+_TEMPORAL_SENTINELS = frozenset("^-")
+_BUILD_HASH_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_COMMIT_TIME_CHARS = frozenset("0123456789T+:Z ^-")
 
 
 VALID_QUERIES = """^.^.*
@@ -106,38 +112,88 @@ VALID_FULL_QUERIES = """*.*.*
 """
 
 
-@cache
+def _parse_column(part: str) -> int | str | None:
+    """Parse a major/minor/patch column. Returns None if it is not a sentinel or a number"""
+    if part in _SENTINELS:
+        return part
+    if part.isascii() and part.isdigit():
+        return int(part)
+    return None
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(s: str) -> datetime.datetime | str:
+    """Try to convert a commit time to a datetime, and just pass it through upon failure"""
+    if not s[:1].isdigit():  # isoformat timestamps always start with the year
+        return s
+    try:
+        return datetime.datetime.fromisoformat(s)
+    except ValueError:
+        return s
+
+
+@lru_cache(maxsize=512)
 def _parse(s: str) -> tuple[int | str, int | str, int | str, str | None, str | None, datetime.datetime | str]:
-    """Parse a query from a string. does not support branch and commit_time"""
-    match = VERSION_SEARCH_REGEX.match(s)
-    if not match:
+    """Parse a query from a string following VERSION_SEARCH_SYNTAX"""
+    # Unlike the regex this replaced (which ended in "$"), a trailing newline is rejected like any other whitespace.
+    # None of the optional parts can contain the separators of the parts before them,
+    # so they can be peeled off from the right
+    head, has_commit_time, commit_time = s.partition("@")
+    head, has_build_hash, build_hash = head.partition("+")
+    major, _, rest = head.partition(".")
+    minor, _, rest = rest.partition(".")
+
+    # The patch itself may be "-", so the branch starts at the first "-" after the patch's first character
+    split = rest.find("-", 1)
+    if split == -1:
+        patch, branch = rest, None
+    else:
+        patch, branch = rest[:split], rest[split + 1 :]
+
+    major, minor, patch = _parse_column(major), _parse_column(minor), _parse_column(patch)
+    if (
+        major is None
+        or minor is None
+        or patch is None
+        or (branch is not None and (not branch or any(c.isspace() for c in branch)))
+        or (has_build_hash and not (build_hash and _BUILD_HASH_CHARS.issuperset(build_hash)))
+        or (
+            has_commit_time and not (commit_time == "*" or (commit_time and _COMMIT_TIME_CHARS.issuperset(commit_time)))
+        )
+    ):
         raise ValueError(f"Invalid version search query: {s}")
 
-    major = match.group(1)
-    minor = match.group(2)
-    patch = match.group(3)
-    branch = match.group(4)
-    build_hash = match.group(5)
-    commit_time = match.group(6)
-    if commit_time is None:
+    if not has_build_hash:
+        build_hash = None
+    if not has_commit_time:
         commit_time = "^"
 
-    if major.isnumeric():
-        major = int(major)
-    if minor.isnumeric():
-        minor = int(minor)
-    if patch.isnumeric():
-        patch = int(patch)
-
-    if commit_time is not None and commit_time not in ("^", "*", "-"):
-        # Try to convert it to a datetime, and just passing it upon failure
-        with contextlib.suppress(ValueError):
-            commit_time = datetime.datetime.fromisoformat(commit_time)
+    if commit_time not in _SENTINELS:
+        commit_time = _parse_iso(commit_time)
 
     return major, minor, patch, branch, build_hash, commit_time
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _format_query(
+    major: int | str,
+    minor: int | str,
+    patch: int | str,
+    branch: str | None,
+    build_hash: str | None,
+    commit_time: datetime.datetime | str,
+) -> str:
+    s = f"{major}.{minor}.{patch}"
+    if branch:
+        s += f"-{branch}"
+    if build_hash:
+        s += f"+{build_hash}"
+    if commit_time:
+        s += f"@{commit_time}"
+    return s
+
+
+@dataclass(frozen=True, slots=True)
 class VersionSearchQuery:
     """A dataclass for a search query. The attributes are ordered by priority"""
 
@@ -159,20 +215,22 @@ class VersionSearchQuery:
     commit_time: datetime.datetime | str = "^"
     "When the build was made (in UTC)"
 
+    _str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         for pos in (self.major, self.minor, self.patch, self.commit_time):
-            if isinstance(pos, str) and pos not in ["^", "*", "-"]:
+            if isinstance(pos, str) and pos not in _SENTINELS:
                 raise ValueError(f'{pos} must be in ["^", "*", "-"]')
-        if self.build_hash and self.build_hash in ["^", "-"]:
+        if self.build_hash and self.build_hash in _TEMPORAL_SENTINELS:
             raise ValueError("build_hash cannot be temporally matched")
-        if self.branch and self.branch in ["^", "-"]:
+        if self.branch and self.branch in _TEMPORAL_SENTINELS:
             raise ValueError("branch cannot be temporally matched")
 
     @classmethod
     def parse(cls, s: str):
         """Parse a query from a string. does not support branch and commit_time"""
 
-        return cls(*_parse(s))
+        return _parse_query(s)
 
     @classmethod
     def default(cls):
@@ -180,44 +238,25 @@ class VersionSearchQuery:
 
     def __str__(self) -> str:
         """Returns a string that can be parsed by parse()"""
-        s = f"{self.major}.{self.minor}.{self.patch}"
-        if self.branch:
-            s += f"-{self.branch}"
-        if self.build_hash:
-            s += f"+{self.build_hash}"
-        if self.commit_time:
-            s += f"@{self.commit_time}"
-        return s
+        if self._str_cache is None:
+            s = _format_query(self.major, self.minor, self.patch, self.branch, self.build_hash, self.commit_time)
+            object.__setattr__(self, "_str_cache", s)  # the dataclass is frozen
+        return self._str_cache
 
     def with_branch(self, branch: str | None = None):
-        return self.__class__(
-            major=self.major,
-            minor=self.minor,
-            patch=self.patch,
-            branch=branch,
-            build_hash=self.build_hash,
-            commit_time=self.commit_time,
-        )
+        return replace(self, branch=branch)
 
     def with_build_hash(self, build_hash: str | None = None):
-        return self.__class__(
-            major=self.major,
-            minor=self.minor,
-            patch=self.patch,
-            branch=self.branch,
-            build_hash=build_hash,
-            commit_time=self.commit_time,
-        )
+        return replace(self, build_hash=build_hash)
 
     def with_commit_time(self, commit_time: datetime.datetime | str):
-        return self.__class__(
-            major=self.major,
-            minor=self.minor,
-            patch=self.patch,
-            branch=self.branch,
-            build_hash=self.build_hash,
-            commit_time=commit_time,
-        )
+        return replace(self, commit_time=commit_time)
+
+
+@lru_cache(maxsize=256)
+def _parse_query(s: str) -> VersionSearchQuery:
+    # Queries are frozen, so the same instance can be handed out for repeated strings
+    return VersionSearchQuery(*_parse(s))
 
 
 # Examples:
@@ -226,48 +265,162 @@ class VersionSearchQuery:
 # VersionSearchQuery("^", "*", "*"): Match any version in the latest major release
 
 
-@dataclass
-class BInfoMatcher:
-    versions: tuple[BasicBuildInfo, ...]
+MATCH_FIELDS = ("build_hash", "major", "minor", "patch", "branch", "commit_time")
+"The fields of a query in the order that BInfoMatcher narrows them down"
 
-    def match(self, s: VersionSearchQuery) -> tuple[BasicBuildInfo, ...]:
-        versions = self.versions
 
-        for place in ("build_hash", "major", "minor", "patch", "branch", "commit_time"):
-            getter = attrgetter(place)
-            p: str | int | datetime.datetime | None = getter(s)
-            if p == "^":
-                # get the max number for `place` in version
-                max_p = max(getter(v) for v in versions)
+def _extreme_indices(column: tuple, indices: set[int], largest: bool) -> set[int]:
+    """Returns the indices whose value in `column` is the largest (or smallest) among `indices`"""
+    it = iter(indices)
+    first = next(it)
+    best = column[first]
+    winners = [first]
+    for j in it:
+        k = column[j]
+        if k == best:
+            winners.append(j)
+        elif (k > best) == largest:  # k beats the current best in the requested direction
+            best, winners = k, [j]
+    return set(winners)
+
 
-                versions = [v for v in versions if getter(v) == max_p]
-            elif p == "*" or p is None:
-                continue  # all versions match
-            elif p == "-":
-                # get the min number for `place` in version
-                min_p = min(getter(v) for v in versions)
+def _narrow_versions(columns: tuple[tuple, ...], candidates: set[int], queries: tuple) -> set[int]:
+    """Narrows down the candidates by several integer columns at once, in a single pass.
 
-                versions = [v for v in versions if getter(v) == min_p]
-            else:
-                versions = [v for v in versions if getter(v) == p]
+    Narrowing the columns one after another keeps exactly the candidates with the largest key, where each
+    column contributes its value for "^", its negated value for "-" and whether it matches for an exact query.
+    If even the largest key fails one of the exact matches, nothing matches.
+    """
+    steps = [(column, p) for column, p in zip(columns, queries, strict=True) if p != "*"]
+    exact = [k for k, (_, p) in enumerate(steps) if p not in _TEMPORAL_SENTINELS]
 
-            if not versions:
-                return ()
+    best = None
+    winners: list[int] = []
+    for j in candidates:
+        key = tuple(column[j] if p == "^" else -column[j] if p == "-" else column[j] == p for column, p in steps)
+        if best is None or key > best:
+            best, winners = key, [j]
+        elif key == best:
+            winners.append(j)
 
-        return tuple(versions)
+    if best is None or not all(best[k] for k in exact):
+        return set()
+    return set(winners)
+
+
+_ALL_STAR = VersionSearchQuery("*", "*", "*", commit_time="*")
+_DEFAULT_LATEST = VersionSearchQuery.default()
+
+
+@dataclass
+class BInfoMatcher:
+    versions: tuple[BasicBuildInfo, ...]
+    # The builds are stored column-wise, one tuple per field in MATCH_FIELDS, so narrowing down a field only
+    # touches that field's values. Columns are built the first time a query narrows down their field
+    _columns: list[tuple | None] = field(init=False, repr=False, compare=False)
+    # Per-field indexes, built the first time a field is narrowed down by a repeated query
+    _sorted: dict[int, list[int]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _by_value: dict[int, dict[Any, list[int]]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _use_indexes: bool = field(init=False, repr=False, compare=False, default=False)
+    _latest: tuple[BasicBuildInfo, ...] | None = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self):
+        self._columns = [None] * len(MATCH_FIELDS)
+
+    def match(self, s: VersionSearchQuery) -> tuple[BasicBuildInfo, ...]:
+        if s == _ALL_STAR:
+            return self.versions
+        if s == _DEFAULT_LATEST:
+            # Remembered so that asking for the default again doesn't redo the match
+            if self._latest is None:
+                self._latest = self._match(s)
+            return self._latest
+        return self._match(s)
+
+    def _match(self, s: VersionSearchQuery) -> tuple[BasicBuildInfo, ...]:
+        versions = self.versions
+        candidates = set(range(len(versions)))  # indices into self.versions
+        candidates = self._narrow(candidates, 0, s.build_hash)
+
+        version_queries = (s.major, s.minor, s.patch)
+        if self._is_sparse(candidates) and sum(p != "*" for p in version_queries) > 1:
+            columns = tuple(self._column(i) if p != "*" else () for i, p in enumerate(version_queries, start=1))
+            candidates = _narrow_versions(columns, candidates, version_queries)
+        else:
+            for i, p in enumerate(version_queries, start=1):
+                candidates = self._narrow(candidates, i, p)
+
+        candidates = self._narrow(candidates, 4, s.branch)
+        candidates = self._narrow(candidates, 5, s.commit_time)
+
+        # A single query is cheaper as a plain scan than building the indexes, so only build them
+        # once the matcher turns out to be reused
+        self._use_indexes = True
+        return tuple(versions[j] for j in sorted(candidates))
+
+    def _is_sparse(self, candidates: set[int]) -> bool:
+        """Whether so few candidates are left that walking a sorted index would mostly skip over
+        builds that were already ruled out, and scanning the candidates directly is cheaper"""
+        return len(candidates) * len(candidates) < len(self.versions)
+
+    def _narrow(self, candidates: set[int], i: int, p: str | int | datetime.datetime | None) -> set[int]:
+        """Narrows down the candidates to the builds whose i-th field (see MATCH_FIELDS) matches p"""
+        if not candidates or p == "*" or p is None:
+            return candidates  # all versions match
+
+        column = self._column(i)
+        if not self._use_indexes:
+            if p in _TEMPORAL_SENTINELS:
+                return _extreme_indices(column, candidates, largest=p == "^")
+            return {j for j in candidates if column[j] == p}
+
+        if p in _TEMPORAL_SENTINELS:
+            if self._is_sparse(candidates):
+                return _extreme_indices(column, candidates, largest=p == "^")
+
+            # walk the field's sorted index from the largest (^) or smallest (-) end
+            # until we reach a build that is still a candidate
+            order = self._sorted_index(i)
+            p = column[next(j for j in (reversed(order) if p == "^" else order) if j in candidates)]
+
+        return candidates.intersection(self._value_index(i).get(p, ()))
+
+    def _column(self, i: int) -> tuple:
+        """The i-th field (see MATCH_FIELDS) of every build"""
+        if (column := self._columns[i]) is None:
+            column = self._columns[i] = tuple(map(attrgetter(MATCH_FIELDS[i]), self.versions))
+        return column
+
+    def _sorted_index(self, i: int) -> list[int]:
+        """The indices of the builds, sorted by their i-th field"""
+        if (order := self._sorted.get(i)) is None:
+            column = self._column(i)
+            order = self._sorted[i] = sorted(range(len(column)), key=column.__getitem__)
+        return order
+
+    def _value_index(self, i: int) -> dict[Any, list[int]]:
+        """The indices of the builds, grouped by the value of their i-th field"""
+        if (by_value := self._by_value.get(i)) is None:
+            by_value = self._by_value[i] = {}
+            for j, value in enumerate(self._column(i)):
+                by_value.setdefault(value, []).append(j)
+        return by_value
 
 
 if __name__ == "__main__":  # Test BInfoMatcher
+    # The same version strings repeat between builds, so share the parsed objects
+    V = lru_cache(maxsize=256)(Version.parse)
+
     builds = (
-        BasicBuildInfo(Version.parse("1.2.3"), "stable", "", datetime.datetime(2020, 5, 4, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("1.2.2"), "stable", "", datetime.datetime(2020, 4, 2, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("1.2.1"), "daily", "", datetime.datetime(2020, 3, 1, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("1.2.4"), "stable", "", datetime.datetime(2020, 6, 3, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("4.2.0"), "stable", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("4.3.0"), "daily", "", datetime.datetime(2024, 7, 28, tzinfo=utc)),
-        BasicBuildInfo(Version.parse("4.3.1"), "daily", "", datetime.datetime(2024, 7, 20, tzinfo=utc)),
+        BasicBuildInfo(V("1.2.3"), "stable", "", datetime.datetime(2020, 5, 4, tzinfo=utc)),
+        BasicBuildInfo(V("1.2.2"), "stable", "", datetime.datetime(2020, 4, 2, tzinfo=utc)),
+        BasicBuildInfo(V("1.2.1"), "daily", "", datetime.datetime(2020, 3, 1, tzinfo=utc)),
+        BasicBuildInfo(V("1.2.4"), "stable", "", datetime.datetime(2020, 6, 3, tzinfo=utc)),
+        BasicBuildInfo(V("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
+        BasicBuildInfo(V("4.2.0"), "stable", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
+        BasicBuildInfo(V("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),
+        BasicBuildInfo(V("4.3.0"), "daily", "", datetime.datetime(2024, 7, 28, tzinfo=utc)),
+        BasicBuildInfo(V("4.3.1"), "daily", "", datetime.datetime(2024, 7, 20, tzinfo=utc)),
     )
 
     matcher = BInfoMatcher(builds)
@@ -276,34 +429,26 @@ if __name__ == "__main__":  # Test BInfoMatcher
         # find the latest minor builds with any patch number
         results = matcher.match(VersionSearchQuery("^", "^", "*"))
         assert results == (
-            BasicBuildInfo(Version.parse("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),
-            BasicBuildInfo(Version.parse("4.3.0"), "daily", "", datetime.datetime(2024, 7, 28, tzinfo=utc)),
-            BasicBuildInfo(Version.parse("4.3.1"), "daily", "", datetime.datetime(2024, 7, 20, tzinfo=utc)),
+            BasicBuildInfo(V("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),
+            BasicBuildInfo(V("4.3.0"), "daily", "", datetime.datetime(2024, 7, 28, tzinfo=utc)),
+            BasicBuildInfo(V("4.3.1"), "daily", "", datetime.datetime(2024, 7, 20, tzinfo=utc)),
         )
 
         # find any version with a patch of 14
         results = matcher.match(VersionSearchQuery("*", "*", 14))
-        assert results == (
-            BasicBuildInfo(Version.parse("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
-        )
+        assert results == (BasicBuildInfo(V("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),)
 
         # find any version in the lts branch
         results = matcher.match(VersionSearchQuery("*", "*", "*", branch="lts"))
-        assert results == (
-            BasicBuildInfo(Version.parse("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),
-        )
+        assert results == (BasicBuildInfo(V("3.6.14"), "lts", "", datetime.datetime(2024, 7, 16, tzinfo=utc)),)
 
         # find the latest daily builds for the latest major release
         results = matcher.match(VersionSearchQuery("^", "*", "*", branch="daily", commit_time="^"))
-        assert results == (
-            BasicBuildInfo(Version.parse("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),
-        )
+        assert results == (BasicBuildInfo(V("4.3.0"), "daily", "", datetime.datetime(2024, 7, 30, tzinfo=utc)),)
 
         # find oldest major release with any minor and largest patch
         results = matcher.match(VersionSearchQuery("-", "*", "^"))
-        assert results == (
-            BasicBuildInfo(Version.parse("1.2.4"), "stable", "", datetime.datetime(2020, 6, 3, tzinfo=utc)),
-        )
+        assert results == (BasicBuildInfo(V("1.2.4"), "stable", "", datetime.datetime(2020, 6, 3, tzinfo=utc)),)
 
         print("test_binfo_matcher successful!")
 
@@ -341,6 +486,10 @@ if __name__ == "__main__":  # Test BInfoMatcher
         assert VersionSearchQuery.parse("*.*.*+cb886aba06d5") == VersionSearchQuery(
             "*", "*", "*", build_hash="cb886aba06d5"
         )
+        # Builds made outside of git report "unknown" as their hash, and saved queries have to parse back
+        query = VersionSearchQuery(4, 2, 0, build_hash="unknown")
+        assert VersionSearchQuery.parse("4.2.0+unknown") == query
+        assert VersionSearchQuery.parse(str(query)) == query
         assert VersionSearchQuery.parse("*.*.*@2024-07-31T23:53:51+00:00") == VersionSearchQuery(
             "*", "*", "*", commit_time=datetime.datetime(2024, 7, 31, 23, 53, 51, tzinfo=utc)
         )
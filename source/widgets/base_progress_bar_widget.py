@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import QProgressBar
 
@@ -10,6 +12,10 @@ class BaseProgressBarWidget(QProgressBar):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.title = ""
+        self.last_progress = (-1, -1)  # (obtained, total) in tenths of a megabyte
+        self._last_value = -1  # in permille of the total
+        self._last_total = -1  # in bytes
+        self._last_emit_ms = 0
 
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setMinimum(0)
@@ -17,22 +23,37 @@ class BaseProgressBarWidget(QProgressBar):
 
     def set_title(self, title: str):
         self.title = title
-        self.setFormat(f"{self.title}: {self.last_progress[0]:.1f} of {self.last_progress[1]:.1f} MB")
+        self.setFormat(f"{self.title}: {self.last_progress[0] / 10:.1f} of {self.last_progress[1] / 10:.1f} MB")
 
     @Slot(int, int)
     def set_progress(self, obtained: int | float, total: int | float, title: str | None = None):
-        if title is not None and title != self.title:
+        title_changed = title is not None and title != self.title
+        if title_changed:
             self.title = title
 
-        # Update appearance
-        self.setMaximum(int(total))
-        self.setValue(int(obtained))
-
-        # Convert bytes to megabytes
-        obtained = obtained / 1048576
-        total = total / 1048576
-
-        # Repaint and call signal
-        self.setFormat(f"{self.title}: {obtained:.1f} of {total:.1f} MB")
-        self.progress_updated.emit(obtained, total)
-        self.last_progress = (obtained, total)
+        # Convert bytes to tenths of a megabyte (1 MB == 1 << 20 bytes)
+        obtained_tenths = (int(obtained) * 10) >> 20
+        total_tenths = (int(total) * 10) >> 20
+
+        # The bar itself counts in permille so that totals under 0.1 MB still fill it
+        value = int(obtained * 1000 // total) if total else 0
+        now = time.monotonic_ns() // 1_000_000
+
+        # Downloads report progress for every chunk, so skip the ones that wouldn't change what is shown.
+        # Within 100ms of the last update, only go through if the percentage moved
+        if not title_changed and int(total) == self._last_total:
+            if obtained_tenths == self.last_progress[0] and value == self._last_value:
+                return
+            if value // 10 == self._last_value // 10 and now - self._last_emit_ms < 100:
+                return
+        self.last_progress = (obtained_tenths, total_tenths)
+        self._last_value = value
+        self._last_total = int(total)
+        self._last_emit_ms = now
+
+        # Update appearance. setValue repaints immediately, so set the format first to have that paint
+        # show the new text. A maximum of 0 shows the busy indicator, so only use it when the total is unknown
+        self.setFormat(f"{self.title}: {obtained_tenths / 10:.1f} of {total_tenths / 10:.1f} MB")
+        self.setMaximum(1000 if total else 0)
+        self.setValue(value)
+        self.progress_updated.emit(obtained_tenths // 10, total_tenths // 10)
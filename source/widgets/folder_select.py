@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import contextlib
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from modules._platform import get_cwd
+from modules._platform import get_cwd, get_platform
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -19,6 +20,33 @@ if TYPE_CHECKING:
     from windows.main_window import BlenderLauncher
 
 
+def can_write_to(path: str) -> bool:
+    """Checks if the folder can be written to"""
+    if get_platform() != "Windows":
+        # access(2) accounts for permissions and read-only mounts without writing anything
+        return os.access(path, os.W_OK | os.X_OK)
+
+    # On Windows os.access only looks at the read-only attribute and ignores ACLs
+    # (e.g. C:/Program Files), so actually try to write a file there
+    with contextlib.suppress(OSError):
+        tempfile = os.path.join(path, "tempfile_checking_write_perms")
+        with open(tempfile, "w") as f:
+            f.write("check,check,check")
+        os.remove(tempfile)
+        return True
+    return False
+
+
+def first_existing_ancestor(path: str) -> str | None:
+    """Returns the path if it exists, otherwise its closest existing parent. None if neither exist"""
+    while not os.path.lexists(path):
+        parent = os.path.dirname(path) or os.curdir
+        if parent == path:
+            return None
+        path = parent
+    return path
+
+
 class FolderSelector(QWidget):
     validity_changed = Signal(bool)
     folder_changed = Signal(Path)
@@ -40,11 +68,11 @@ class FolderSelector(QWidget):
         self.default_choose_dir = default_choose_dir_folder or self.default_folder or Path(".")
         self.check_relatives = check_relatives
         self.check_perms = check_perms
+        self.cwd = os.path.normcase(get_cwd())
 
         if default_folder is not None:
             self.line_edit.setText(str(default_folder))
         self.line_edit.setReadOnly(True)
-        self.line_edit.textChanged.connect(self.check_write_permission)
         self.button = QPushButton(launcher.icons.folder, "")
         self.button.setFixedWidth(25)
         self.button.clicked.connect(self.prompt_folder)
@@ -66,11 +94,16 @@ class FolderSelector(QWidget):
         else:
             self.line_edit.setText(new_library_folder)
             self.default_choose_dir = new_library_folder
-            if (self.check_perms and self.check_write_permission()) or not self.check_perms:
+            if self._assume_writable(new_library_folder) or not self.check_perms:
                 self.folder_changed.emit(new_library_folder)
 
     def set_folder(self, folder: Path, relative: bool | None = None):
-        if folder.is_relative_to(get_cwd()):
+        folder_str = str(folder)
+        is_relative = False
+        with contextlib.suppress(ValueError):  # e.g. paths on different drives
+            # normcase because paths are case insensitive on Windows
+            is_relative = os.path.normcase(os.path.commonpath((folder_str, self.cwd))) == self.cwd
+        if is_relative:
             if relative is None:
                 self.dlg = PopupWindow(
                     parent=self.launcher,
@@ -86,30 +119,22 @@ class FolderSelector(QWidget):
                 return
 
             if relative:
-                folder = folder.relative_to(get_cwd())
+                folder = Path(os.path.relpath(folder_str, self.cwd))
 
         self.line_edit.setText(str(folder))
         self.default_choose_dir = folder
-        if (self.check_perms and self.check_write_permission()) or not self.check_perms:
+        if self._assume_writable(str(folder)) or not self.check_perms:
             self.folder_changed.emit(folder)
 
     def check_write_permission(self) -> bool:
-        path = Path(self.line_edit.text())
-        if not path.exists():
-            for parent in path.parents:
-                if parent.exists():
-                    path = parent
-                    break
-
-        # check if the folder can be written to
-        can_write = False
-        with contextlib.suppress(OSError):
-            tempfile = path / "tempfile_checking_write_perms"
-            with tempfile.open("w") as f:
-                f.write("check,check,check")
-            tempfile.unlink()
-            can_write = True
+        path = first_existing_ancestor(os.path.normpath(self.line_edit.text()))
+        return self.__set_valid(path is not None and can_write_to(path))
+
+    def _assume_writable(self, path: str) -> bool:
+        """Checks a folder returned by the file dialog. It is known to exist, so the ancestor walk is skipped"""
+        return self.__set_valid(can_write_to(path))
 
+    def __set_valid(self, can_write: bool) -> bool:
         # warn the user by changing the highlight color of the line edit
         old_valid = self.__is_valid
         self.__is_valid = can_write
@@ -9,11 +9,8 @@ from typing import TYPE_CHECKING
 
 from modules._platform import get_platform, is_frozen
 from modules.settings import (
+    SettingsSnapshot,
     get_actual_library_folder,
-    get_actual_library_folder_no_fallback,
-    get_enable_high_dpi_scaling,
-    get_show_tray_icon,
-    get_use_system_titlebar,
     set_enable_high_dpi_scaling,
     set_library_folder,
     set_scrape_automated_builds,
@@ -31,6 +28,7 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
     QLabel,
+    QProgressBar,
     QTextEdit,
     QVBoxLayout,
     QWizardPage,
@@ -93,14 +91,14 @@ PERM_WARNING_LABEL_LINUX = (
 
 
 class ChooseLibraryPage(BasicOnboardingPage):
-    def __init__(self, prop_settings: PropogatedSettings, parent: BlenderLauncher):
+    def __init__(self, prop_settings: PropogatedSettings, settings: SettingsSnapshot, parent: BlenderLauncher):
         super().__init__(prop_settings, parent=parent)
         self.setTitle("Blender Launcher library location")
         self.setSubTitle("Make sure that this folder has enough storage to download and store all the builds you want.")
         self.launcher = parent
         self.lf = FolderSelector(
             parent,
-            default_folder=get_actual_library_folder_no_fallback() or Path("~/Documents/BlenderBuilds").expanduser(),
+            default_folder=settings.library_folder or Path("~/Documents/BlenderBuilds").expanduser(),
             default_choose_dir_folder=get_actual_library_folder(),
             parent=self,
         )
@@ -153,13 +151,13 @@ class ChooseLibraryPage(BasicOnboardingPage):
 
 
 class RepoSelectPage(BasicOnboardingPage):
-    def __init__(self, prop_settings: PropogatedSettings, parent: BlenderLauncher):
+    def __init__(self, prop_settings: PropogatedSettings, settings: SettingsSnapshot, parent: BlenderLauncher):
         super().__init__(prop_settings, parent=parent)
         self.setTitle("Blender repositories visibility")
         self.setSubTitle("Enable/disable certain builds of blender to be visible/scraped.")
         self.layout_ = QVBoxLayout(self)
 
-        self.group = RepoGroup(self)
+        self.group = RepoGroup(self, settings=settings.repos)
         self.layout_.addWidget(self.group)
 
     def evaluate(self):
@@ -202,6 +200,7 @@ class ShortcutsPage(BasicOnboardingPage):
         self.setSubTitle(subtitle)
 
         self.platform = get_platform()
+        self.default_shortcut_destination = get_default_shortcut_destination()
         self.layout_ = QVBoxLayout(self)
 
         explanation = ""
@@ -220,7 +219,7 @@ class ShortcutsPage(BasicOnboardingPage):
         if self.platform == "Linux":
             self.select = FolderSelector(
                 parent,
-                default_folder=get_default_shortcut_destination().parent,
+                default_folder=self.default_shortcut_destination.parent,
                 check_relatives=False,
             )
             self.select.setEnabled(False)
@@ -245,7 +244,7 @@ class ShortcutsPage(BasicOnboardingPage):
                 assert self.select.path is not None
 
                 if self.select.path.is_dir():
-                    pth = self.select.path / get_default_shortcut_destination().name
+                    pth = self.select.path / self.default_shortcut_destination.name
                 else:
                     pth = self.select.path
 
@@ -258,7 +257,7 @@ class ShortcutsPage(BasicOnboardingPage):
         elif self.platform == "Windows":
             if self.addtostart.isChecked():
                 generate_program_shortcut(
-                    get_default_shortcut_destination(),
+                    self.default_shortcut_destination,
                     exe=str(self.prop_settings.exe_location),
                 )
             if self.addtodesk.isChecked():
@@ -295,20 +294,20 @@ automatically scales the user interface based on the monitor's pixel density."""
 
 
 class AppearancePage(BasicOnboardingPage):
-    def __init__(self, prop_settings: PropogatedSettings, parent: BlenderLauncher):
+    def __init__(self, prop_settings: PropogatedSettings, settings: SettingsSnapshot, parent: BlenderLauncher):
         super().__init__(prop_settings, parent=parent)
         self.setTitle("Blender Launcher appearance")
         self.setSubTitle("Configure how Blender Launcher Looks")
         self.layout_ = QVBoxLayout(self)
 
         self.titlebar = QCheckBox("Use System Titlebar", self)
-        self.titlebar.setChecked(get_use_system_titlebar())
+        self.titlebar.setChecked(settings.use_system_titlebar)
         if get_platform() == "Linux":
             titlebar_label = QLabel(TITLEBAR_LABEL_TEXT_LINUX, self)
         else:
             titlebar_label = QLabel(TITLEBAR_LABEL_TEXT, self)
         self.highdpiscaling = QCheckBox("High DPI Scaling")
-        self.highdpiscaling.setChecked(get_enable_high_dpi_scaling())
+        self.highdpiscaling.setChecked(settings.enable_high_dpi_scaling)
         highdpiscaling_label = QLabel(HIGH_DPI_TEXT)
 
         self.layout_.addWidget(titlebar_label)
@@ -326,14 +325,14 @@ BACKGROUND_SUBTITLE = """Blender Launcher can be kept alive in the background wi
 
 
 class BackgroundRunningPage(BasicOnboardingPage):
-    def __init__(self, prop_settings: PropogatedSettings, parent: BlenderLauncher):
+    def __init__(self, prop_settings: PropogatedSettings, settings: SettingsSnapshot, parent: BlenderLauncher):
         super().__init__(prop_settings, parent=parent)
         self.setTitle("Running Blender Launcher in the background")
         self.setSubTitle(BACKGROUND_SUBTITLE)
         self.layout_ = QVBoxLayout(self)
 
         self.enable_btn = QCheckBox("Run Blender Launcher in the background (Minimise to tray)")
-        self.enable_btn.setChecked(get_show_tray_icon())
+        self.enable_btn.setChecked(settings.show_tray_icon)
         self.layout_.addWidget(self.enable_btn)
 
     def evaluate(self):
@@ -345,6 +344,16 @@ class CommittingPage(QWizardPage):
         super().__init__(parent=parent)
         self.setTitle("Committing settings changes...")
         self.setSubTitle("This should take less than a second.")
+        self.layout_ = QVBoxLayout(self)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setMinimum(0)
+        self.progress_bar.setMaximum(0)  # busy until the first page finishes
+        self.layout_.addWidget(self.progress_bar)
+
+    def set_progress(self, finished: int, total: int, title: str):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(finished)
+        self.progress_bar.setFormat(f'Finished "{title}" ({finished}/{total})')
 
 
 class ErrorOccurredPage(QWizardPage):
@@ -1,14 +1,9 @@
-from modules.settings import (
-    get_scrape_automated_builds,
-    get_scrape_bfa_builds,
-    get_scrape_stable_builds,
-    get_show_bfa_builds,
-    get_show_daily_builds,
-    get_show_experimental_and_patch_builds,
-    get_show_stable_builds,
-)
+from __future__ import annotations
+
+from modules.settings import RepoSettings, get_repo_settings
 from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
+    QAbstractButton,
     QButtonGroup,
     QFrame,
     QSizePolicy,
@@ -18,8 +13,10 @@ from widgets.repo_visibility_view import RepoUserView
 
 
 class RepoGroup(QFrame):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings: RepoSettings | None = None):
         super().__init__(parent)
+        if settings is None:
+            settings = get_repo_settings()
         self.setProperty("SettingsGroup", True)
         self.setContentsMargins(0, 0, 0, 0)
         self.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Maximum)
@@ -27,31 +24,31 @@ class RepoGroup(QFrame):
         self.stable_repo = RepoUserView(
             "Stable",
             "Production-ready builds.",
-            library=get_show_stable_builds(),
-            download=get_scrape_stable_builds(),
+            library=settings.show_stable_builds,
+            download=settings.scrape_stable_builds,
             parent=self,
         )
         self.daily_repo = RepoUserView(
             "Daily",
             "Builds created every day. They have the latest features and bug fixes, but they can be unstable.",
-            library=get_show_daily_builds(),
-            download=get_scrape_automated_builds(),
+            library=settings.show_daily_builds,
+            download=settings.scrape_automated_builds,
             bind_download_to_library=False,
             parent=self,
         )
         self.experimental_repo = RepoUserView(
             "Experimental and Patch",
             "These have new features that may end up in official Blender releases. They can be unstable.",
-            library=get_show_experimental_and_patch_builds(),
-            download=get_scrape_automated_builds(),
+            library=settings.show_experimental_and_patch_builds,
+            download=settings.scrape_automated_builds,
             bind_download_to_library=False,
             parent=self,
         )
         self.bforartists_repo = RepoUserView(
             "Bforartists",
             "A popular fork of Blender with the goal of improving the UI.",
-            library=get_show_bfa_builds(),
-            download=get_scrape_bfa_builds(),
+            library=settings.show_bfa_builds,
+            download=settings.scrape_bfa_builds,
             parent=self,
         )
 
@@ -62,6 +59,7 @@ class RepoGroup(QFrame):
         self.automated_groups.setExclusive(False)
         self.daily_repo.add_downloads_to_group(self.automated_groups)
         self.experimental_repo.add_downloads_to_group(self.automated_groups)
+        self.automated_groups.buttonToggled.connect(self._sync_group)
 
         self.check_if_both_automated_are_disabled()
 
@@ -78,6 +76,17 @@ class RepoGroup(QFrame):
         for widget in self.repos:
             self.layout_.addWidget(widget)
 
+    @Slot(QAbstractButton, bool)
+    def _sync_group(self, btn: QAbstractButton, checked: bool):
+        # Mirror the toggled button onto the rest of the group in one pass.
+        # The group's own signal is blocked so those changes don't come back here
+        grp = self.automated_groups
+        grp.blockSignals(True)
+        for b in grp.buttons():
+            if b is not btn:
+                b.setChecked(checked)
+        grp.blockSignals(False)
+
     @Slot()
     def check_if_both_automated_are_disabled(self):
         if (not self.daily_repo.library) and (not self.experimental_repo.library):
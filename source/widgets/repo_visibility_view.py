@@ -17,6 +17,9 @@ class RepoUserView(QWidget):
     library_changed = Signal(bool)
     download_changed = Signal(bool)
 
+    # Shared by every view; QFont is implicitly shared so this is only built once
+    _TITLE_FONT: QFont | None = None
+
     def __init__(
         self,
         name: str,
@@ -32,9 +35,10 @@ class RepoUserView(QWidget):
 
         self.title_label = QLabel(name, self)
         self.title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        font = QFont(self.title_label.font())
-        font.setPointSize(11)
-        self.title_label.setFont(font)
+        if RepoUserView._TITLE_FONT is None:
+            RepoUserView._TITLE_FONT = QFont(self.title_label.font())
+            RepoUserView._TITLE_FONT.setPointSize(11)
+        self.title_label.setFont(RepoUserView._TITLE_FONT)
         if description:
             self.title_label.setToolTip(description)
 
@@ -79,11 +83,9 @@ class RepoUserView(QWidget):
 
     def add_library_to_group(self, grp: QButtonGroup):
         grp.addButton(self.library_enable_button)
-        grp.buttonToggled.connect(self.__library_toggled)
 
     def add_downloads_to_group(self, grp: QButtonGroup):
         grp.addButton(self.download_enable_button)
-        grp.buttonToggled.connect(self.__download_toggled)
 
     def __library_button_toggled(self, checked: bool):
         self.title_label.setEnabled(checked)
@@ -104,14 +106,6 @@ class RepoUserView(QWidget):
         else:
             self.download_enable_button.setChecked(self.previous_download)
 
-    def __library_toggled(self, btn: QCheckBox, checked: bool):
-        if btn is not self and checked != self.library_enable_button.isChecked():
-            self.library_enable_button.setChecked(checked)
-
-    def __download_toggled(self, btn: QCheckBox, checked: bool):
-        if btn is not self and checked != self.download_enable_button.isChecked():
-            self.download_enable_button.setChecked(checked)
-
     @property
     def download(self):
         return self.download_enable_button.isChecked()
@@ -67,6 +67,7 @@ class LaunchingWindow(BaseWindow):
         self.builds: dict[str, BuildInfo] = {}
         self.list_items: dict[BBI, EnablableListWidgetItem] = {}
         self.label_elements: dict[BBI, tuple[str, str, str, str]] = {}
+        self.matcher: BInfoMatcher | None = None  # rebuilt whenever self.builds gets a new build
         self.drawing_task = DrawLibraryTask()
         self.drawing_task.found.connect(self._build_found)
         self.drawing_task.finished.connect(self.search_finished)
@@ -269,6 +270,7 @@ class LaunchingWindow(BaseWindow):
                 basic_info = BBI.from_buildinfo(info)
 
                 self.builds[combined_url] = info
+                self.matcher = None
                 self.list_items[basic_info] = item
                 self.label_elements[basic_info] = semversion
 
@@ -406,8 +408,9 @@ class LaunchingWindow(BaseWindow):
         """Updates the visibility of each item in the list depending on the search query. returns matches"""
         assert self.version_query is not None
         logger.debug(f"QUERY: {self.version_query!r}")
-        matcher = self.make_matcher()
-        matches = matcher.match(self.version_query)
+        if self.matcher is None:
+            self.matcher = self.make_matcher()
+        matches = self.matcher.match(self.version_query)
         versions = {b.version for b in matches}
 
         enabled_builds: list[BuildInfo] = []
@@ -5,11 +5,12 @@ import os
 import sys
 import traceback
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from modules._platform import get_platform
-from modules.settings import set_first_time_setup_seen
+from modules.settings import get_settings_snapshot, set_first_time_setup_seen
 from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import (
     QVBoxLayout,
@@ -31,6 +32,8 @@ from widgets.onboarding_setup.wizard_pages import (
 from windows.base_window import BaseWindow
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from PySide6.QtGui import QCloseEvent
     from semver import Version
     from windows.main_window import BlenderLauncher
@@ -45,15 +48,18 @@ class Committer(QThread):
 
     completed = Signal()
     err = Signal(tuple)
+    progress = Signal(int, int, str)  # (finished pages, total pages, title of the finished page)
 
     def run(self):
         finished_pages = ""
         try:
-            for page in self.pages:
+            for i, page in enumerate(self.pages, 1):
                 page.evaluate()
-                txt = f'Finished page "{page.title()}"'
+                title = page.title()
+                txt = f'Finished page "{title}"'
                 logging.info(txt)
                 finished_pages += txt + "\n"
+                self.progress.emit(i, len(self.pages), title)
             self.completed.emit()
         except Exception:
             # show the exception
@@ -62,6 +68,38 @@ class Committer(QThread):
             self.err.emit((exc, text))
 
 
+class LazyWizard(QWizard):
+    """A QWizard that only builds each page once the user moves on to it"""
+
+    def __init__(self, page_factories: list[Callable[[], BasicOnboardingPage]], parent=None):
+        super().__init__(parent)
+        self.page_factories = page_factories
+        self.pages: list[BasicOnboardingPage] = []
+        self.add_next_page()  # The first page is shown right away
+
+    def add_next_page(self):
+        page = self.page_factories[len(self.pages)]()
+        self.pages.append(page)
+        self.addPage(page)
+
+    def has_unbuilt_pages(self) -> bool:
+        return len(self.pages) < len(self.page_factories)
+
+    def nextId(self) -> int:
+        next_id = super().nextId()
+        if next_id == -1 and self.currentId() != -1 and self.has_unbuilt_pages():
+            # Keep showing the "Next" button; the page gets built in validateCurrentPage
+            return self.currentId() + 1
+        return next_id
+
+    def validateCurrentPage(self) -> bool:
+        if not super().validateCurrentPage():
+            return False
+        if self.currentId() == len(self.pages) - 1 and self.has_unbuilt_pages():
+            self.add_next_page()
+        return True
+
+
 class OnboardingWindow(BaseWindow):
     accepted = Signal()
     cancelled = Signal()
@@ -72,8 +110,22 @@ class OnboardingWindow(BaseWindow):
         self.setMinimumWidth(768)
         self.setMinimumHeight(512)
         self.parent_ = parent
-        # A wizard showing the settings being configured
-        self.wizard = QWizard(self)
+        self.prop_settings = PropogatedSettings()
+        settings = get_settings_snapshot()  # One read of the config for every page
+
+        # A wizard showing the settings being configured.
+        # Only the welcome page is built up front, the rest are built as the user reaches them
+        self.wizard = LazyWizard(
+            [
+                partial(WelcomePage, version, self.prop_settings, parent),
+                partial(ChooseLibraryPage, self.prop_settings, settings, parent),
+                partial(RepoSelectPage, self.prop_settings, settings, parent),
+                partial(ShortcutsPage, self.prop_settings, parent),
+                partial(AppearancePage, self.prop_settings, settings, parent),
+                partial(BackgroundRunningPage, self.prop_settings, settings, parent),
+            ],
+            self,
+        )
         self.wizard.setWizardStyle(QWizard.WizardStyle.ClassicStyle)
         self.wizard.setPixmap(QWizard.WizardPixmap.LogoPixmap, parent.icons.taskbar.pixmap(64, 64))
         self.wizard.button(QWizard.WizardButton.NextButton).setProperty("CreateButton", True)  # type: ignore
@@ -93,24 +145,15 @@ class OnboardingWindow(BaseWindow):
         self.error_wizard.button(QWizard.WizardButton.FinishButton).setProperty("LaunchButton", True)
         self.error_wizard.setButtonText(QWizard.WizardButton.FinishButton, "OK")
 
-        self.prop_settings = PropogatedSettings()
-
-        self.pages: list[BasicOnboardingPage] = [
-            WelcomePage(version, self.prop_settings, parent),
-            ChooseLibraryPage(self.prop_settings, parent),
-            RepoSelectPage(self.prop_settings, parent),
-            ShortcutsPage(self.prop_settings, parent),
-            AppearancePage(self.prop_settings, parent),
-            BackgroundRunningPage(self.prop_settings, parent),
-        ]
-
-        for page in self.pages:
-            self.wizard.addPage(page)
+        # Filled in by the wizard as pages get built. The Finish button is only reachable from the last page,
+        # so every page exists by the time the committer runs
+        self.pages = self.wizard.pages
 
         self.committer = Committer(self.pages)
         self.committer.completed.connect(self.__commiter_completed)
         self.committer.err.connect(self.__commiter_errored)
         self.committing_page = CommittingPage(parent)
+        self.committer.progress.connect(self.committing_page.set_progress)
         self.commit_wizard.addPage(self.committing_page)
         self.error_page = ErrorOccurredPage(parent)
         self.error_wizard.addPage(self.error_page)